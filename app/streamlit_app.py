@@ -1,21 +1,30 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import queue
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 
 # Ensure project root is on the path so `src` is importable
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import plotly.graph_objects as go
+import pandas as pd
 import streamlit as st
 
 from src.utils.document_parser import extract_text_from_pdf_bytes, extract_text_from_txt_bytes
+from src.utils.json_output import dump_json_pretty
 from src.utils.mock_data import SAMPLE_LEGAL_TEXT
 from src.utils.pdf_export import build_translated_document_pdf
 from src.workflow.orchestrator import WorkflowOrchestrator
 
 WORKFLOW_STEPS = ["intake", "planner", "execution", "qa", "judge", "delivery"]
+LIVE_REFRESH_SECONDS = 0.2
+LIVE_EVENT_LIMIT = 120
+STEP_TABLE_COLUMNS = ["step", "status"]
+EVENT_TABLE_COLUMNS = ["time", "step", "status", "level", "message"]
 
 
 st.set_page_config(
@@ -25,8 +34,7 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-st.markdown(
-    """
+_PAGE_CSS = """
 <style>
 @import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Sans:wght@400;500;700&family=Fraunces:opsz,wght@9..144,500;9..144,700&display=swap');
 
@@ -160,19 +168,18 @@ html, body, [class*="css"] {
   }
 }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
 
-st.markdown(
-    """
+_HERO_HTML = """
 <div class="hero">
   <h1>Agentic Translation Workflow</h1>
   <div class="tagline">Master/Worker orchestration with live step tracking, QA + Judge validation, SLA visibility, and export-ready reports.</div>
 </div>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+# Stylesheet and hero share one element: Streamlit drops anything a rerun does not re-emit,
+# so this has to be sent every run, but once instead of twice.
+st.markdown(_PAGE_CSS + _HERO_HTML, unsafe_allow_html=True)
 
 
 def _default_step_status() -> dict[str, str]:
@@ -182,6 +189,7 @@ def _default_step_status() -> dict[str, str]:
 def _init_session_state() -> None:
     st.session_state.setdefault("last_result", None)
     st.session_state.setdefault("last_request", None)
+    st.session_state.setdefault("last_saved_request_id", None)
     st.session_state.setdefault("doc_text_input", "")
     st.session_state.setdefault("page_count_input", 3)
     st.session_state.setdefault("uploaded_text_cache", "")
@@ -190,7 +198,9 @@ def _init_session_state() -> None:
     st.session_state.setdefault("queued_doc_text", None)
     st.session_state.setdefault("queued_page_count", None)
     st.session_state.setdefault("live_step_status", _default_step_status())
-    st.session_state.setdefault("live_events", [])
+    st.session_state.setdefault("live_events", deque(maxlen=LIVE_EVENT_LIMIT))
+    st.session_state.setdefault("live_streamed_chars", 0)
+    st.session_state.setdefault("live_current_agent", None)
     st.session_state.setdefault("live_run_active", False)
 
 
@@ -211,6 +221,27 @@ def _apply_queued_input_updates() -> None:
         st.session_state.queued_page_count = None
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _cached_pdf_extract(digest: str, _data: bytes) -> tuple[str, int]:
+    # Keyed on the upload digest only (underscore args are not hashed), so each file is parsed once.
+    return extract_text_from_pdf_bytes(_data)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_translated_pdf(translated_text: str) -> bytes:
+    return build_translated_document_pdf({"translated_text": translated_text})
+
+
+@st.cache_resource
+def _output_writer() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="output-writer")
+
+
+def _write_latest_output(save_path: Path, result: dict) -> None:
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+    save_path.write_bytes(dump_json_pretty(result))
+
+
 def _status_class(status: str) -> str:
     normalized = (status or "").lower()
     if normalized == "completed":
@@ -221,38 +252,66 @@ def _status_class(status: str) -> str:
 
 
 def _render_step_table(placeholder, step_status: dict[str, str]) -> None:
-    rows = []
-    for step in WORKFLOW_STEPS:
-        rows.append({"step": step, "status": step_status.get(step, "pending")})
-    placeholder.table(rows)
+    rows = [(step, step_status.get(step, "pending")) for step in WORKFLOW_STEPS]
+    placeholder.dataframe(
+        pd.DataFrame(rows, columns=STEP_TABLE_COLUMNS),
+        hide_index=True,
+    )
 
 
-def _render_event_table(placeholder, events: list[dict]) -> None:
+def _render_event_table(placeholder, events: deque[dict] | list[dict]) -> None:
     if not events:
         placeholder.info("No events yet.")
         return
-    trimmed = events[-10:]
-    rows = []
-    for event in trimmed:
-        rows.append(
-            {
-                "time": event.get("timestamp", "")[-8:],
-                "step": event.get("step", ""),
-                "status": event.get("status", ""),
-                "level": event.get("level", ""),
-                "message": event.get("message", ""),
-            }
+    trimmed = islice(events, max(0, len(events) - 10), None)
+    rows = [
+        (
+            event.get("timestamp", "")[-8:],
+            event.get("step", ""),
+            event.get("status", ""),
+            event.get("level", ""),
+            event.get("message", ""),
         )
-    placeholder.table(rows)
+        for event in trimmed
+    ]
+    placeholder.dataframe(
+        pd.DataFrame(rows, columns=EVENT_TABLE_COLUMNS),
+        hide_index=True,
+    )
 
 
 def _progress_from_steps(step_status: dict[str, str]) -> float:
     total = len(WORKFLOW_STEPS)
-    completed = sum(1 for status in step_status.values() if status == "completed")
-    in_progress = sum(1 for status in step_status.values() if status == "in_progress")
+    completed = in_progress = 0
+    for status in step_status.values():
+        if status == "completed":
+            completed += 1
+        elif status == "in_progress":
+            in_progress += 1
     return min(1.0, (completed + (0.5 * in_progress)) / max(1, total))
 
 
+def _render_live_tracking(progress_placeholder, step_table_placeholder, event_table_placeholder) -> None:
+    step_status = st.session_state.live_step_status
+    if st.session_state.live_events:
+        progress = _progress_from_steps(step_status)
+        progress_text = (
+            f"Workflow progress: {int(progress * 100)}% | Current: {st.session_state.live_current_agent or 'n/a'}"
+        )
+        if st.session_state.live_streamed_chars:
+            progress_text += f" | Streamed: {st.session_state.live_streamed_chars} chars"
+        progress_placeholder.progress(progress, text=progress_text)
+    _render_step_table(step_table_placeholder, step_status)
+    _render_event_table(event_table_placeholder, st.session_state.live_events)
+
+
+def _live_tracking_panel() -> tuple:
+    # The live event drain writes into these placeholders, so updates redraw only this panel.
+    placeholders = (st.empty(), st.empty(), st.empty())
+    _render_live_tracking(*placeholders)
+    return placeholders
+
+
 _init_session_state()
 _apply_queued_input_updates()
 
@@ -356,7 +415,8 @@ with tab_new:
 
             try:
                 if file_name.lower().endswith(".pdf"):
-                    extracted_text, extracted_pages = extract_text_from_pdf_bytes(file_bytes)
+                    digest = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+                    extracted_text, extracted_pages = _cached_pdf_extract(digest, file_bytes)
                 else:
                     extracted_text = extract_text_from_txt_bytes(file_bytes)
             except Exception as exc:
@@ -396,11 +456,7 @@ with tab_new:
             st.info("No file uploaded. You can still paste text manually.")
 
     st.markdown("### Live Tracking")
-    progress_placeholder = st.empty()
-    step_table_placeholder = st.empty()
-    event_table_placeholder = st.empty()
-    _render_step_table(step_table_placeholder, st.session_state.live_step_status)
-    _render_event_table(event_table_placeholder, st.session_state.live_events)
+    live_placeholders = _live_tracking_panel()
 
     if start_clicked:
         raw_text = st.session_state.doc_text_input.strip()
@@ -409,7 +465,9 @@ with tab_new:
             st.stop()
 
         st.session_state.live_step_status = _default_step_status()
-        st.session_state.live_events = []
+        st.session_state.live_events = deque(maxlen=LIVE_EVENT_LIMIT)
+        st.session_state.live_streamed_chars = 0
+        st.session_state.live_current_agent = None
         st.session_state.live_run_active = True
 
         request_payload = {
@@ -424,26 +482,45 @@ with tab_new:
         }
         st.session_state.last_request = request_payload
 
+        event_queue: queue.Queue = queue.Queue()
+
         def progress_callback(event: dict, snapshot: dict) -> None:
-            st.session_state.live_step_status = snapshot.get("step_status", _default_step_status())
-            st.session_state.live_events.append(event)
-            st.session_state.live_events = st.session_state.live_events[-120:]
-
-            progress = _progress_from_steps(st.session_state.live_step_status)
-            progress_placeholder.progress(
-                progress,
-                text=f"Workflow progress: {int(progress * 100)}% | Current: {snapshot.get('current_agent') or 'n/a'}",
-            )
-            _render_step_table(step_table_placeholder, st.session_state.live_step_status)
-            _render_event_table(event_table_placeholder, st.session_state.live_events)
+            # Runs on the workflow thread: only hand events off, Streamlit calls stay on the script thread.
+            event_queue.put((event, snapshot))
+
+        def _drain_events() -> None:
+            drained = False
+            while True:
+                try:
+                    event, snapshot = event_queue.get_nowait()
+                except queue.Empty:
+                    break
+                drained = True
+                # The snapshot holds a read-only view of the live state; keep a plain copy in the session.
+                st.session_state.live_step_status = dict(snapshot.get("step_status", _default_step_status()))
+                st.session_state.live_current_agent = snapshot.get("current_agent")
+                if event.get("status") == "streaming":
+                    # Token deltas only advance the progress caption; the event log keeps step transitions.
+                    st.session_state.live_streamed_chars += len(event.get("message", ""))
+                else:
+                    st.session_state.live_events.append(event)
+            if drained:
+                _render_live_tracking(*live_placeholders)
 
         with st.spinner("Executing workflow..."):
             orchestrator = WorkflowOrchestrator(use_real_llm=use_real_llm)
-            st.session_state.last_result = orchestrator.execute_workflow_sync(
-                request=request_payload,
-                auto_approve=auto_approve,
-                progress_callback=progress_callback,
-            )
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    orchestrator.execute_workflow_sync,
+                    request=request_payload,
+                    auto_approve=auto_approve,
+                    progress_callback=progress_callback,
+                )
+                # Redraw at a fixed rate regardless of how fast the workflow emits events.
+                while not wait([future], timeout=LIVE_REFRESH_SECONDS).done:
+                    _drain_events()
+            _drain_events()
+            st.session_state.last_result = future.result()
 
         st.session_state.live_run_active = False
         final_status = st.session_state.last_result.get("status", "unknown")
@@ -486,14 +563,15 @@ with tab_monitor:
             st.metric("Errors", len(errors))
 
         st.subheader("Step status")
-        step_rows = [{"step": step, "status": step_status.get(step, "pending")} for step in WORKFLOW_STEPS]
-        st.table(step_rows)
+        _render_step_table(st.empty(), step_status)
 
         st.subheader("Event timeline")
         _render_event_table(st.empty(), events)
 
         agent_timings = metadata.get("agent_timings", {})
         if agent_timings:
+            import plotly.graph_objects as go
+
             labels = list(agent_timings.keys())
             values = list(agent_timings.values())
             fig = go.Figure(
@@ -562,14 +640,14 @@ with tab_results:
         )
         st.download_button(
             label="Download JSON output",
-            data=json.dumps(result, indent=2),
+            data=dump_json_pretty(result),
             file_name="translation_output.json",
             mime="application/json",
             use_container_width=True,
         )
 
         try:
-            pdf_bytes = build_translated_document_pdf(result)
+            pdf_bytes = _cached_translated_pdf(result.get("translated_text", ""))
             st.download_button(
                 label="Download translated document (.pdf)",
                 data=pdf_bytes,
@@ -626,6 +704,8 @@ with tab_arch:
     )
 
 save_path = Path("examples/example_outputs/latest_streamlit_output.json")
-if st.session_state.last_result:
-    save_path.parent.mkdir(parents=True, exist_ok=True)
-    save_path.write_text(json.dumps(st.session_state.last_result, indent=2), encoding="utf-8")
+last_result = st.session_state.last_result
+if last_result and last_result.get("request_id") != st.session_state.last_saved_request_id:
+    # Every run gets a fresh request_id, so this writes once per result rather than on every rerun.
+    st.session_state.last_saved_request_id = last_result.get("request_id")
+    _output_writer().submit(_write_latest_output, save_path, last_result)
@@ -1,15 +1,93 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import os
-from typing import Any
-
-from langchain_core.output_parsers import StrOutputParser
-from langchain_core.prompts import ChatPromptTemplate
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
 
 from src.agents.base_agent import BaseWorkerAgent
 from src.models.workflow_state import WorkflowState
 
+_LLM_TRANSLATION_TEMPLATE = (
+    "Translate the following document from {source_language} to {target_language}. "
+    "Preserve numbering and legal tone.\n\nText:\n{text}"
+)
+_DIRECT_GEMINI_TEMPLATE = (
+    "Translate from {source_language} to {target_language}. "
+    "Preserve formatting, numbering, and legal/medical tone as applicable.\n\n"
+    "Text:\n{text}"
+)
+_CHUNK_BREAK = "===CHUNK_BREAK==="
+_CHUNK_BREAK_JOINER = f"\n{_CHUNK_BREAK}\n"
+_DIRECT_GEMINI_BATCH_TEMPLATE = (
+    "Translate from {source_language} to {target_language}. "
+    "Preserve formatting, numbering, and legal/medical tone as applicable. "
+    f"The text contains several sections separated by lines reading {_CHUNK_BREAK}; "
+    "keep every separator line exactly as it is and translate only the sections.\n\n"
+    "Text:\n{text}"
+)
+
+_PROXY_KEYS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy")
+_BROKEN_PROXY_MARKER = "127.0.0.1:9"
+
+# Runs of text that contain no blank-line separator; equivalent to split("\n\n") once stripped.
+_PARAGRAPH_PATTERN = re.compile(r"(?:[^\n]|\n(?!\n))+")
+
+_MOCK_REPLACEMENTS = {
+    "agreement": "acuerdo",
+    "client": "cliente",
+    "firm": "firma",
+    "services": "servicios",
+    "payment": "pago",
+    "termination": "terminacion",
+    "legal": "legal",
+}
+# Lower and title-case variants in one alternation: a single scan replaces the old
+# per-key str.replace passes.
+_MOCK_MAP = {
+    **_MOCK_REPLACEMENTS,
+    **{source.title(): target.title() for source, target in _MOCK_REPLACEMENTS.items()},
+}
+_MOCK_PATTERN = re.compile("|".join(re.escape(source) for source in _MOCK_MAP))
+
+def _build_translation_chain(llm: Any) -> Any:
+    # Imported here so mock-only runs never load langchain_core.
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+
+    return ChatPromptTemplate.from_template(_LLM_TRANSLATION_TEMPLATE) | llm | StrOutputParser()
+
+
+# Process-wide LRU of successful model translations. Orchestrators (and their agents) are
+# built per request, so a per-instance cache would never see a repeated document.
+_TRANSLATION_CACHE_SIZE = 2048
+_translation_cache: OrderedDict[tuple[bytes, str, str, str], str] = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+
+def _translation_cache_get(key: tuple[bytes, str, str, str]) -> str | None:
+    with _translation_cache_lock:
+        translated = _translation_cache.get(key)
+        if translated is not None:
+            _translation_cache.move_to_end(key)
+        return translated
+
+
+def _translation_cache_put(key: tuple[bytes, str, str, str], translated: str) -> None:
+    with _translation_cache_lock:
+        _translation_cache[key] = translated
+        _translation_cache.move_to_end(key)
+        while len(_translation_cache) > _TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+
+
+def _translation_cache_clear() -> None:
+    with _translation_cache_lock:
+        _translation_cache.clear()
+
 
 class ExecutionAgent(BaseWorkerAgent):
     def __init__(
@@ -18,81 +96,235 @@ class ExecutionAgent(BaseWorkerAgent):
         llm: Any | None = None,
         google_api_key: str | None = None,
         gemini_model: str = "gemini-2.5-flash",
+        max_parallel: int = 8,
+        gemini_batch_size: int = 8,
     ) -> None:
         super().__init__(name=name, llm=llm)
         self.google_api_key = google_api_key
         self.gemini_model = gemini_model
+        self.max_parallel = max(1, max_parallel)
+        self.gemini_batch_size = max(1, gemini_batch_size)
+        # Shared by every workflow this agent serves, so concurrent documents split one budget
+        # of in-flight model calls instead of each opening max_parallel of their own.
+        self._call_slots: asyncio.Semaphore | None = None
+        self._call_slots_loop: asyncio.AbstractEventLoop | None = None
+        # Parse the prompt template and compose the runnable once, not per chunk.
+        self._chain = _build_translation_chain(self.llm) if self.llm else None
+        self._gemini_client: Any | None = None
+        self._gemini_client_error: str | None = None
+        if self.google_api_key:
+            self._init_gemini_client()
+
+    def _init_gemini_client(self) -> None:
+        try:
+            from google import genai
+        except Exception as exc:
+            self._gemini_client_error = f"Direct Gemini SDK unavailable, fallback used: {exc}"
+            return
+
+        # The client builds its HTTP transports (and reads proxy settings) in its constructor, so the
+        # broken proxy variables only need to be scrubbed around that call.
+        saved_proxy_values = self._strip_broken_proxy_env(self._detect_broken_proxy_keys())
+        try:
+            self._gemini_client = genai.Client(api_key=self.google_api_key)
+        except Exception as exc:
+            self._gemini_client_error = f"Direct Gemini client unavailable, fallback used: {exc}"
+        finally:
+            self._restore_proxy_env(saved_proxy_values)
 
-    async def execute(self, state: WorkflowState) -> dict:
+    async def execute(
+        self,
+        state: WorkflowState,
+        on_token: Callable[[str], None] | None = None,
+        on_chunk_done: Callable[[int, int, str], None] | None = None,
+    ) -> dict:
         self._log_execution(state, "Executing translation")
-        chunks = [chunk.strip() for chunk in state.raw_text.split("\n\n") if chunk.strip()]
+        chunks = [
+            chunk
+            for chunk in (match.group(0).strip() for match in _PARAGRAPH_PATTERN.finditer(state.raw_text))
+            if chunk
+        ]
         if not chunks:
             return {"translation": "", "method": "none", "segments": 0}
 
-        if state.parallel_execution and len(chunks) > 1:
-            translated_chunks = await asyncio.gather(
-                *[self._translate_chunk(chunk, state) for chunk in chunks]
-            )
+        # Repeated paragraphs (boilerplate, signature blocks) are translated once.
+        unique_chunks = list(dict.fromkeys(chunks))
+        total = len(unique_chunks)
+        batch_size = self.gemini_batch_size if self._batches_direct_gemini() else 1
+        batch_starts = range(0, total, batch_size)
+        translated_chunks = [""] * total
+
+        def _record(start: int, results: list[str]) -> None:
+            for offset, text in enumerate(results):
+                translated_chunks[start + offset] = text
+                if on_chunk_done:
+                    on_chunk_done(start + offset, total, text)
+
+        call_slots = self._get_call_slots()
+        if state.parallel_execution and len(batch_starts) > 1:
+
+            async def _bounded(start: int) -> tuple[int, list[str] | Exception]:
+                async with call_slots:
+                    try:
+                        return start, await self._translate_batch(
+                            unique_chunks[start : start + batch_size], state, on_token=on_token
+                        )
+                    except Exception as exc:
+                        return start, exc
+
+            # Report chunks as they finish instead of waiting on the slowest one.
+            for next_done in asyncio.as_completed([_bounded(start) for start in batch_starts]):
+                start, result = await next_done
+                if isinstance(result, Exception):
+                    state.add_warning(f"Chunk translation failed, fallback used: {result}")
+                    result = [
+                        self._mock_translate(chunk, state.target_language)
+                        for chunk in unique_chunks[start : start + batch_size]
+                    ]
+                _record(start, result)
         else:
-            translated_chunks = []
-            for chunk in chunks:
-                translated_chunks.append(await self._translate_chunk(chunk, state))
+            for start in batch_starts:
+                async with call_slots:
+                    results = await self._translate_batch(
+                        unique_chunks[start : start + batch_size], state, on_token=on_token
+                    )
+                _record(start, results)
 
-        translation = "\n\n".join(translated_chunks)
+        translated_by_chunk = dict(zip(unique_chunks, translated_chunks))
+        translation = "\n\n".join(translated_by_chunk[chunk] for chunk in chunks)
         method = "langchain_llm" if self.llm else ("direct_gemini" if self.google_api_key else "mock")
         return {"translation": translation, "method": method, "segments": len(chunks)}
 
-    async def _translate_chunk(self, chunk: str, state: WorkflowState) -> str:
-        if self.llm:
-            prompt = ChatPromptTemplate.from_template(
-                (
-                    "Translate the following document from {source_language} to {target_language}. "
-                    "Preserve numbering and legal tone.\n\nText:\n{text}"
-                )
+    def _get_call_slots(self) -> asyncio.Semaphore:
+        """Cap in-flight model calls so concurrent chunks and documents do not trip provider rate limits."""
+        # A semaphore binds to the loop it first waits on; sync callers start a new loop per run.
+        loop = asyncio.get_running_loop()
+        if self._call_slots is None or self._call_slots_loop is not loop:
+            self._call_slots = asyncio.Semaphore(self.max_parallel)
+            self._call_slots_loop = loop
+        return self._call_slots
+
+    def _batches_direct_gemini(self) -> bool:
+        return self._chain is None and self._gemini_client is not None and self.gemini_batch_size > 1
+
+    async def _translate_batch(
+        self,
+        chunks: list[str],
+        state: WorkflowState,
+        on_token: Callable[[str], None] | None = None,
+    ) -> list[str]:
+        results = [self._cached_translation(chunk, state) for chunk in chunks]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if len(missing) == 1:
+            results[missing[0]] = await self._translate_chunk(chunks[missing[0]], state, on_token=on_token)
+        elif missing:
+            translated = await self._translate_with_chunk_breaks(
+                [chunks[index] for index in missing], state, on_token=on_token
             )
-            chain = prompt | self.llm | StrOutputParser()
+            for index, text in zip(missing, translated):
+                results[index] = text
+        return results
+
+    async def _translate_with_chunk_breaks(
+        self,
+        chunks: list[str],
+        state: WorkflowState,
+        on_token: Callable[[str], None] | None = None,
+    ) -> list[str]:
+        # One request for several chunks amortizes the per-call round trip; the delimiter
+        # lets the response be split back into the original chunks.
+        translated = await self._translate_chunk_with_direct_gemini(
+            _CHUNK_BREAK_JOINER.join(chunks),
+            state,
+            on_token=on_token,
+            template=_DIRECT_GEMINI_BATCH_TEMPLATE,
+        )
+        if translated is None:
+            return [self._mock_translate(chunk, state.target_language) for chunk in chunks]
+        parts = [part.strip() for part in translated.split(_CHUNK_BREAK)]
+        if len(parts) != len(chunks) or not all(parts):
+            state.add_warning("Batched Gemini response lost chunk breaks, chunks retried individually.")
+            return [await self._translate_chunk(chunk, state, on_token=on_token) for chunk in chunks]
+        for chunk, part in zip(chunks, parts):
+            self._store_translation(chunk, state, part)
+        return parts
+
+    def _cache_key(self, chunk: str, state: WorkflowState) -> tuple[bytes, str, str, str]:
+        digest = hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).digest()
+        return (digest, state.source_language, state.target_language, self.gemini_model)
+
+    def _cached_translation(self, chunk: str, state: WorkflowState) -> str | None:
+        # Mock output is not cached, and retries exist to get a fresh translation.
+        if state.retry_count or (self._chain is None and self._gemini_client is None):
+            return None
+        return _translation_cache_get(self._cache_key(chunk, state))
+
+    def _store_translation(self, chunk: str, state: WorkflowState, translated: str) -> None:
+        _translation_cache_put(self._cache_key(chunk, state), translated)
+
+    async def _translate_chunk(
+        self,
+        chunk: str,
+        state: WorkflowState,
+        on_token: Callable[[str], None] | None = None,
+    ) -> str:
+        cached = self._cached_translation(chunk, state)
+        if cached is not None:
+            return cached
+        if self._chain:
             try:
-                return await chain.ainvoke(
+                translated = await self._chain.ainvoke(
                     {
                         "source_language": state.source_language,
                         "target_language": state.target_language,
                         "text": chunk,
                     }
                 )
+                self._store_translation(chunk, state, translated)
+                return translated
             except Exception as exc:
                 state.add_warning(f"LLM translation failed, fallback used: {exc}")
         if self.google_api_key:
-            translated = await self._translate_chunk_with_direct_gemini(chunk, state)
+            translated = await self._translate_chunk_with_direct_gemini(chunk, state, on_token=on_token)
             if translated:
+                self._store_translation(chunk, state, translated)
                 return translated
         return self._mock_translate(chunk, state.target_language)
 
-    async def _translate_chunk_with_direct_gemini(self, chunk: str, state: WorkflowState) -> str | None:
-        try:
-            from google import genai
-        except Exception as exc:
-            state.add_warning(f"Direct Gemini SDK unavailable, fallback used: {exc}")
+    async def _translate_chunk_with_direct_gemini(
+        self,
+        chunk: str,
+        state: WorkflowState,
+        on_token: Callable[[str], None] | None = None,
+        template: str = _DIRECT_GEMINI_TEMPLATE,
+    ) -> str | None:
+        client = self._gemini_client
+        if client is None:
+            state.add_warning(self._gemini_client_error or "Direct Gemini client unavailable, fallback used.")
             return None
 
-        prompt = (
-            f"Translate from {state.source_language} to {state.target_language}. "
-            "Preserve formatting, numbering, and legal/medical tone as applicable.\n\n"
-            f"Text:\n{chunk}"
+        prompt = template.format(
+            source_language=state.source_language,
+            target_language=state.target_language,
+            text=chunk,
         )
-        broken_proxy_keys = self._detect_broken_proxy_keys()
+        loop = asyncio.get_running_loop()
 
         def _call_gemini() -> str:
-            saved_proxy_values = self._strip_broken_proxy_env(broken_proxy_keys)
-            try:
-                client = genai.Client(api_key=self.google_api_key)
-                response = client.models.generate_content(
-                    model=self.gemini_model,
-                    contents=prompt,
-                )
-            finally:
-                self._restore_proxy_env(saved_proxy_values)
-            text = getattr(response, "text", None)
-            return (text or "").strip()
+            # Stream the response so token deltas reach the caller as they arrive;
+            # the joined text is still returned for the translation aggregate.
+            parts: list[str] = []
+            for piece in client.models.generate_content_stream(
+                model=self.gemini_model,
+                contents=prompt,
+            ):
+                text = getattr(piece, "text", None)
+                if not text:
+                    continue
+                parts.append(text)
+                if on_token:
+                    loop.call_soon_threadsafe(on_token, text)
+            return "".join(parts).strip()
 
         try:
             translated = await asyncio.to_thread(_call_gemini)
@@ -104,16 +336,11 @@ class ExecutionAgent(BaseWorkerAgent):
             state.add_warning(f"Direct Gemini translation failed, fallback used: {exc}")
             return None
 
-    def _detect_broken_proxy_keys(self) -> list[str]:
-        keys = ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"]
-        broken: list[str] = []
-        for key in keys:
-            value = os.environ.get(key, "")
-            if "127.0.0.1:9" in value:
-                broken.append(key)
-        return broken
+    @staticmethod
+    def _detect_broken_proxy_keys() -> tuple[str, ...]:
+        return tuple(key for key in _PROXY_KEYS if _BROKEN_PROXY_MARKER in os.environ.get(key, ""))
 
-    def _strip_broken_proxy_env(self, keys: list[str]) -> dict[str, str]:
+    def _strip_broken_proxy_env(self, keys: tuple[str, ...]) -> dict[str, str]:
         saved: dict[str, str] = {}
         for key in keys:
             if key in os.environ:
@@ -126,17 +353,5 @@ class ExecutionAgent(BaseWorkerAgent):
             os.environ[key] = value
 
     def _mock_translate(self, text: str, target_language: str) -> str:
-        replacements = {
-            "agreement": "acuerdo",
-            "client": "cliente",
-            "firm": "firma",
-            "services": "servicios",
-            "payment": "pago",
-            "termination": "terminacion",
-            "legal": "legal",
-        }
-        translated = text
-        for source, target in replacements.items():
-            translated = translated.replace(source, target)
-            translated = translated.replace(source.title(), target.title())
+        translated = _MOCK_PATTERN.sub(lambda match: _MOCK_MAP[match.group(0)], text)
         return f"[{target_language}] {translated}"
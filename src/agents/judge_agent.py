@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import re
+import asyncio
 
 from src.agents.base_agent import BaseWorkerAgent
 from src.models.workflow_state import WorkflowState
+from src.utils.text_stats import TextStats, get_text_stats
 
 
 class JudgeAgent(BaseWorkerAgent):
@@ -13,18 +14,12 @@ class JudgeAgent(BaseWorkerAgent):
 
     async def execute(self, state: WorkflowState) -> dict:
         self._log_execution(state, "Running translation judge checks")
-        source = state.raw_text or ""
-        translated = state.translation_output or ""
-
-        checks = {
-            "non_empty_translation": self._check_non_empty(translated),
-            "length_ratio": self._check_length_ratio(source, translated),
-            "number_integrity": self._check_number_integrity(source, translated),
-            "line_structure": self._check_line_structure(source, translated),
-            "lexical_shift": self._check_lexical_shift(source, translated, state.source_language, state.target_language),
-        }
+        if state.parallel_execution:
+            # The whole batch takes one hop off the event loop; per-check threads would only add overhead under the GIL.
+            checks, score = await asyncio.to_thread(self._score_translation, state)
+        else:
+            checks, score = self._score_translation(state)
 
-        score = round(sum(check["score"] for check in checks.values()) / len(checks), 2)
         action = "accept"
         rationale = "Translation is acceptable."
 
@@ -53,24 +48,56 @@ class JudgeAgent(BaseWorkerAgent):
             "rationale": rationale,
         }
 
-    def _check_non_empty(self, translated: str) -> dict:
-        ok = bool(translated.strip())
+    def _score_translation(self, state: WorkflowState) -> tuple[dict, float]:
+        source = state.raw_text or ""
+        translated = state.translation_output or ""
+        source_stats = get_text_stats(source)
+        translated_stats = get_text_stats(translated)
+
+        non_empty = self._check_non_empty(translated_stats)
+        length_ratio = self._check_length_ratio(source_stats, translated_stats)
+        number_integrity = self._check_number_integrity(source_stats, translated_stats)
+        line_structure = self._check_line_structure(source_stats, translated_stats)
+        lexical_shift = self._check_lexical_shift(
+            source_stats, translated_stats, state.source_language, state.target_language
+        )
+        checks = {
+            "non_empty_translation": non_empty,
+            "length_ratio": length_ratio,
+            "number_integrity": number_integrity,
+            "line_structure": line_structure,
+            "lexical_shift": lexical_shift,
+        }
+
+        score_sum = (
+            non_empty["score"]
+            + length_ratio["score"]
+            + number_integrity["score"]
+            + line_structure["score"]
+            + lexical_shift["score"]
+        )
+        return checks, round(score_sum / 5, 2)
+
+    def _check_non_empty(self, translated: TextStats) -> dict:
+        # str.split() and str.strip() share a whitespace definition, so this matches `bool(text.strip())`.
+        ok = translated.word_count > 0
         return {"passed": ok, "score": 100.0 if ok else 0.0, "message": "Non-empty translation"}
 
-    def _check_length_ratio(self, source: str, translated: str) -> dict:
-        source_words = max(1, len(source.split()))
-        translated_words = len(translated.split())
+    def _check_length_ratio(self, source: TextStats, translated: TextStats) -> dict:
+        source_words = max(1, source.word_count)
+        translated_words = translated.word_count
         ratio = translated_words / source_words
         passed = 0.65 <= ratio <= 1.8
         score = 100.0 if passed else 40.0
         return {"passed": passed, "score": score, "ratio": ratio, "message": "Length ratio"}
 
-    def _check_number_integrity(self, source: str, translated: str) -> dict:
-        src_nums = re.findall(r"\d+(?:\.\d+)?", source)
-        dst_nums = re.findall(r"\d+(?:\.\d+)?", translated)
+    def _check_number_integrity(self, source: TextStats, translated: TextStats) -> dict:
+        src_nums = source.numbers
+        dst_nums = translated.numbers
         if not src_nums:
             return {"passed": True, "score": 100.0, "message": "No source numerics to compare"}
-        overlap = sum(1 for n in src_nums if n in dst_nums)
+        dst_set = set(dst_nums)
+        overlap = sum(1 for n in src_nums if n in dst_set)
         coverage = overlap / len(src_nums)
         passed = coverage >= 0.9
         score = round(coverage * 100, 2)
@@ -83,19 +110,33 @@ class JudgeAgent(BaseWorkerAgent):
             "message": "Numeric integrity",
         }
 
-    def _check_line_structure(self, source: str, translated: str) -> dict:
-        src_lines = source.count("\n")
-        dst_lines = translated.count("\n")
+    def _check_line_structure(self, source: TextStats, translated: TextStats) -> dict:
+        src_lines = source.newline_count
+        dst_lines = translated.newline_count
         diff = abs(src_lines - dst_lines)
         passed = diff <= 4
         score = 100.0 if passed else max(35.0, 100.0 - (diff * 10))
         return {"passed": passed, "score": score, "line_diff": diff, "message": "Line structure preservation"}
 
-    def _check_lexical_shift(self, source: str, translated: str, source_lang: str, target_lang: str) -> dict:
-        src_tokens = set(token.lower() for token in re.findall(r"[A-Za-z]{3,}", source))
-        dst_tokens = set(token.lower() for token in re.findall(r"[A-Za-z]{3,}", translated))
+    def _check_lexical_shift(
+        self,
+        source: TextStats,
+        translated: TextStats,
+        source_lang: str,
+        target_lang: str,
+    ) -> dict:
+        src_tokens = source.alpha_tokens
+        dst_tokens = translated.alpha_tokens
         if not src_tokens:
             return {"passed": True, "score": 100.0, "message": "Lexical shift skipped"}
+        if not dst_tokens:
+            # Empty or non-Latin output (common on failed calls) cannot overlap; same result as the full path.
+            return {
+                "passed": True,
+                "score": 100.0,
+                "overlap_ratio": 0.0,
+                "message": "Lexical shift between source and translation",
+            }
 
         overlap_ratio = len(src_tokens.intersection(dst_tokens)) / len(src_tokens)
         # For same-language translation overlap can be high; only enforce this strongly when languages differ.
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import time
 from datetime import datetime
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from src.models.workflow_state import QAStatus, WorkflowState, WorkflowStatus
 from src.utils.logger import setup_logger
@@ -10,6 +11,20 @@ from src.utils.metrics import SLAMonitor
 from src.workflow.routing import determine_next_step
 from src.workflow.state_manager import StateManager
 
+_iso_second_cache: tuple[int, str] = (-1, "")
+
+
+def _fast_iso_now() -> str:
+    """UTC timestamp in the same naive ISO form as datetime.utcnow().isoformat()."""
+    global _iso_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second_cache
+    if cached_second != seconds:
+        # Events cluster within the same second, so the strftime part is formatted once per second.
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _iso_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
 
 class MasterAgent:
     """
@@ -17,24 +32,35 @@ class MasterAgent:
     It is the only agent that controls workflow routing.
     """
 
-    def __init__(self, worker_agents: dict[str, Any], sla_seconds: int = 120) -> None:
+    def __init__(
+        self,
+        worker_agents: dict[str, Any],
+        sla_seconds: int = 120,
+        save_interval_seconds: float = 1.0,
+    ) -> None:
         self.worker_agents = worker_agents
         self.logger = setup_logger("master_agent")
         self.state_manager = StateManager()
         self.sla_monitor = SLAMonitor(sla_seconds)
+        self.save_interval_seconds = save_interval_seconds
+        # Last snapshot write per in-flight request; terminal (forced) saves drop the entry.
+        self._last_save_ts: dict[str, float] = {}
+        self._pending_template = {name: "pending" for name in worker_agents}
 
     async def orchestrate(
         self,
-        initial_request: dict,
+        initial_request: Mapping[str, Any],
         auto_approve: bool = True,
         progress_callback: Callable[[dict, dict], None] | None = None,
     ) -> WorkflowState:
-        state = WorkflowState(**initial_request)
+        state = WorkflowState.from_request(initial_request)
         state.start_time = datetime.utcnow()
+        # start_time is for display and reporting; the SLA is measured on the monotonic clock.
+        sla_started_ns = time.monotonic_ns()
         state.status = WorkflowStatus.IN_PROGRESS
-        state.run_status = WorkflowStatus.IN_PROGRESS.value
-        state.step_status = {step: "pending" for step in self.worker_agents.keys()}
-        self.state_manager.save(state)
+        state.run_status = WorkflowStatus.IN_PROGRESS
+        state.step_status = self._pending_template.copy()
+        self._save_if_due(state)
         self.logger.info("Starting workflow %s", state.request_id)
         self._emit_event(
             state,
@@ -53,7 +79,7 @@ class MasterAgent:
                     if auto_approve:
                         state.approval_granted = True
                         state.status = WorkflowStatus.IN_PROGRESS
-                        state.run_status = WorkflowStatus.IN_PROGRESS.value
+                        state.run_status = WorkflowStatus.IN_PROGRESS
                         state.pause_reason = None
                         self._emit_event(
                             state,
@@ -66,7 +92,7 @@ class MasterAgent:
                         current_step = "execution"
                         continue
                     state.status = WorkflowStatus.PAUSED
-                    state.run_status = WorkflowStatus.PAUSED.value
+                    state.run_status = WorkflowStatus.PAUSED
                     state.pause_reason = "Awaiting human approval"
                     self._emit_event(
                         state,
@@ -76,7 +102,7 @@ class MasterAgent:
                         level="warning",
                         progress_callback=progress_callback,
                     )
-                    self.state_manager.save(state)
+                    self._save_if_due(state, force=True)
                     return state
 
                 if (
@@ -99,11 +125,11 @@ class MasterAgent:
 
                 state.route_history.append(current_step)
                 state = await self._execute_step(current_step, state, progress_callback=progress_callback)
-                self.state_manager.save(state)
+                self._save_if_due(state)
 
-                if self.sla_monitor.is_breached(state.start_time):
+                if self.sla_monitor.is_breached(sla_started_ns):
                     sla_warning = "SLA threshold exceeded"
-                    if sla_warning not in state.warnings:
+                    if not state.has_warning(sla_warning):
                         state.add_warning(sla_warning)
                         self._emit_event(
                             state,
@@ -123,7 +149,6 @@ class MasterAgent:
                 state.end_time = datetime.utcnow()
                 state.run_status = self._derive_run_status(state)
                 state = await self._execute_step("delivery", state, progress_callback=progress_callback)
-                self.state_manager.save(state)
 
             state.status = WorkflowStatus.COMPLETED
             state.end_time = state.end_time or datetime.utcnow()
@@ -136,12 +161,12 @@ class MasterAgent:
                 level="info",
                 progress_callback=progress_callback,
             )
-            self.state_manager.save(state)
+            self._save_if_due(state, force=True)
             return state
         except Exception as exc:
             state.status = WorkflowStatus.FAILED
             state.end_time = datetime.utcnow()
-            state.run_status = WorkflowStatus.FAILED.value
+            state.run_status = WorkflowStatus.FAILED
             state.add_error(str(exc))
             self._emit_event(
                 state,
@@ -151,10 +176,24 @@ class MasterAgent:
                 level="error",
                 progress_callback=progress_callback,
             )
-            self.state_manager.save(state)
+            self._save_if_due(state, force=True)
             self.logger.exception("Workflow failed: %s", exc)
             return state
 
+    def _save_if_due(self, state: WorkflowState, force: bool = False) -> None:
+        """Write a snapshot on terminal transitions, otherwise at most once per save interval."""
+        now = time.monotonic()
+        if force:
+            self._last_save_ts.pop(state.request_id, None)
+            # Terminal snapshots must be on disk before the caller sees the final state.
+            self.state_manager.save(state)
+            return
+        last_saved = self._last_save_ts.get(state.request_id)
+        if last_saved is not None and now - last_saved < self.save_interval_seconds:
+            return
+        self._last_save_ts[state.request_id] = now
+        self.state_manager.enqueue(state)
+
     async def _execute_step(
         self,
         agent_name: str,
@@ -175,9 +214,17 @@ class MasterAgent:
             progress_callback=progress_callback,
         )
 
-        started = time.perf_counter()
+        agent = self.worker_agents[agent_name]
+        started_ns = time.perf_counter_ns()
         try:
-            result = await self.worker_agents[agent_name].execute(state)
+            if agent_name == "execution" and progress_callback:
+                result = await agent.execute(
+                    state,
+                    on_token=self._token_emitter(state, progress_callback),
+                    on_chunk_done=self._chunk_emitter(state, progress_callback),
+                )
+            else:
+                result = await agent.execute(state)
         except Exception as exc:
             state.set_step_status(agent_name, "failed")
             self._emit_event(
@@ -190,7 +237,7 @@ class MasterAgent:
             )
             raise
 
-        elapsed = time.perf_counter() - started
+        elapsed = (time.perf_counter_ns() - started_ns) / 1_000_000_000
         state.agent_timings[agent_name] = elapsed
         self._merge_result(state, agent_name, result)
         state.set_step_status(agent_name, "completed")
@@ -241,22 +288,24 @@ class MasterAgent:
         return False
 
     def _qa_failed(self, state: WorkflowState) -> bool:
-        qa_status = state.qa_result.get("status")
-        if isinstance(qa_status, QAStatus):
-            return qa_status == QAStatus.FAIL
-        return str(qa_status).lower() == QAStatus.FAIL.value
+        return str(state.qa_result.get("status")).lower() == QAStatus.FAIL
 
     def _derive_run_status(self, state: WorkflowState) -> str:
         if state.status == WorkflowStatus.FAILED:
-            return WorkflowStatus.FAILED.value
+            return WorkflowStatus.FAILED
         if state.status == WorkflowStatus.PAUSED:
-            return WorkflowStatus.PAUSED.value
+            return WorkflowStatus.PAUSED
 
-        qa_failed = self._qa_failed(state)
-        judge_action = str(state.judge_result.get("action", "accept")).lower()
-        if state.errors or state.warnings or qa_failed or judge_action != "accept" or state.retry_count > 0:
+        # Cheapest checks first so the common warning paths short-circuit before any dict lookups.
+        if (
+            state.retry_count > 0
+            or state.errors
+            or state.warnings
+            or str(state.judge_result.get("action", "accept")).lower() != "accept"
+            or self._qa_failed(state)
+        ):
             return "completed_with_warnings"
-        return WorkflowStatus.COMPLETED.value
+        return WorkflowStatus.COMPLETED
 
     def _emit_event(
         self,
@@ -268,25 +317,63 @@ class MasterAgent:
         progress_callback: Callable[[dict, dict], None] | None = None,
     ) -> None:
         event = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _fast_iso_now(),
             "step": step,
             "status": status,
             "level": level,
             "message": message,
         }
         state.add_event(event)
-        if progress_callback:
-            snapshot = {
-                "request_id": state.request_id,
-                "current_agent": state.current_agent,
-                "status": state.status.value,
-                "run_status": state.run_status,
-                "step_status": dict(state.step_status),
-                "retry_count": state.retry_count,
-                "warnings": list(state.warnings),
-                "errors": list(state.errors),
+        if progress_callback is not None:
+            progress_callback(event, self._snapshot(state))
+
+    def _token_emitter(
+        self,
+        state: WorkflowState,
+        progress_callback: Callable[[dict, dict], None],
+    ) -> Callable[[str], None]:
+        # Token deltas go to the live callback only; they are not recorded in state.events.
+        def on_token(token: str) -> None:
+            event = {
+                "timestamp": _fast_iso_now(),
+                "step": "execution",
+                "status": "streaming",
+                "level": "info",
+                "message": token,
             }
-            progress_callback(event, snapshot)
+            progress_callback(event, self._snapshot(state))
+
+        return on_token
+
+    def _chunk_emitter(
+        self,
+        state: WorkflowState,
+        progress_callback: Callable[[dict, dict], None],
+    ) -> Callable[[int, int, str], None]:
+        def on_chunk_done(index: int, total: int, text: str) -> None:
+            event = {
+                "timestamp": _fast_iso_now(),
+                "step": "execution",
+                "status": "chunk_completed",
+                "level": "info",
+                "message": f"Chunk {index + 1}/{total} translated.",
+            }
+            progress_callback(event, self._snapshot(state))
+
+        return on_chunk_done
+
+    def _snapshot(self, state: WorkflowState) -> dict:
+        # Callbacks only read the snapshot, so step_status is a read-only view rather than a copy.
+        return {
+            "request_id": state.request_id,
+            "current_agent": state.current_agent,
+            "status": state.status,
+            "run_status": state.run_status,
+            "step_status": MappingProxyType(state.step_status),
+            "retry_count": state.retry_count,
+            "warnings": tuple(state.warnings),
+            "errors": tuple(state.errors),
+        }
 
     def _refresh_delivery_metadata(self, state: WorkflowState) -> None:
         if not state.final_output:
@@ -298,4 +385,4 @@ class MasterAgent:
         metadata["errors"] = list(state.errors)
         metadata["route_history"] = list(state.route_history)
         metadata["translation_method"] = state.translation_method
-        state.final_output["status"] = state.run_status or state.status.value
+        state.final_output["status"] = state.run_status or state.status
@@ -2,13 +2,23 @@ from __future__ import annotations
 
 from src.agents.base_agent import BaseWorkerAgent
 from src.models.workflow_state import WorkflowState
+from src.utils.text_stats import get_text_stats
+
+_COMPLEXITY_MULT = {"low": 1.0, "medium": 1.5, "high": 2.0}
+
+
+def _estimate_duration(word_count: int, complexity: str) -> int:
+    base = max(5, word_count // 25)
+    return int(base * _COMPLEXITY_MULT.get(complexity, 1.0))
 
 
 class PlannerAgent(BaseWorkerAgent):
     async def execute(self, state: WorkflowState) -> dict:
         self._log_execution(state, "Building execution plan")
         metadata = state.normalized_request
-        word_count = int(metadata.get("word_count", len(state.raw_text.split())))
+        word_count = metadata.get("word_count")
+        # The fallback used to be evaluated eagerly, splitting the whole text even when intake had counted it.
+        word_count = int(word_count) if word_count is not None else get_text_stats(state.raw_text).word_count
         complexity = metadata.get("estimated_complexity", "low")
 
         plan = ["normalize_content"]
@@ -18,7 +28,7 @@ class PlannerAgent(BaseWorkerAgent):
             plan.append("translate_single_pass")
         plan += ["run_quality_checks", "format_output"]
 
-        estimated_seconds = self._estimate_duration(word_count, complexity)
+        estimated_seconds = _estimate_duration(word_count, complexity)
         requires_approval = estimated_seconds > 60 or state.page_count > 15
         approval_reason = (
             "Estimated runtime exceeds approval threshold."
@@ -31,8 +41,3 @@ class PlannerAgent(BaseWorkerAgent):
             "requires_approval": requires_approval,
             "approval_reason": approval_reason,
         }
-
-    def _estimate_duration(self, word_count: int, complexity: str) -> int:
-        base = max(5, word_count // 25)
-        multiplier = {"low": 1.0, "medium": 1.5, "high": 2.0}.get(complexity, 1.0)
-        return int(base * multiplier)
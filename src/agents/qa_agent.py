@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+
 from src.agents.base_agent import BaseWorkerAgent
 from src.models.workflow_state import QAStatus, WorkflowState
+from src.utils.text_stats import get_lowered_text, get_text_stats
+
+_LEGAL_TERMS = ("agreement", "contract", "party", "clause", "liability")
 
 
 class QAAgent(BaseWorkerAgent):
     async def execute(self, state: WorkflowState) -> dict:
         self._log_execution(state, "Running QA checks")
-        checks = {
-            "length_check": self._check_length(state),
-            "format_check": self._check_format(state),
-            "terminology_check": self._check_terminology(state),
-        }
+        if state.parallel_execution:
+            # Off-load the scans as one unit so long documents don't stall other workflows on the loop.
+            checks = await asyncio.to_thread(self._run_checks, state)
+        else:
+            checks = self._run_checks(state)
 
         failed_checks = [name for name, result in checks.items() if not result["passed"]]
         warning_checks = [name for name, result in checks.items() if result.get("warning", False)]
@@ -30,18 +35,25 @@ class QAAgent(BaseWorkerAgent):
             "recommendations": self._generate_recommendations(failed_checks, warning_checks),
         }
 
+    def _run_checks(self, state: WorkflowState) -> dict:
+        return {
+            "length_check": self._check_length(state),
+            "format_check": self._check_format(state),
+            "terminology_check": self._check_terminology(state),
+        }
+
     def _check_length(self, state: WorkflowState) -> dict:
         if not state.translation_output:
             return {"passed": False, "ratio": 0.0, "message": "Translation is empty"}
-        original_words = max(1, len(state.raw_text.split()))
-        translated_words = len(state.translation_output.split())
+        original_words = max(1, get_text_stats(state.raw_text).word_count)
+        translated_words = get_text_stats(state.translation_output).word_count
         ratio = translated_words / original_words
         passed = 0.65 <= ratio <= 1.6
         return {"passed": passed, "ratio": ratio, "message": "Length check"}
 
     def _check_format(self, state: WorkflowState) -> dict:
-        original_lines = state.raw_text.count("\n")
-        translated_lines = (state.translation_output or "").count("\n")
+        original_lines = get_text_stats(state.raw_text).newline_count
+        translated_lines = get_text_stats(state.translation_output or "").newline_count
         line_diff = abs(original_lines - translated_lines)
         # For long documents, strict absolute line matching creates false failures.
         dynamic_tolerance = max(4, int(max(1, original_lines) * 0.35))
@@ -56,8 +68,8 @@ class QAAgent(BaseWorkerAgent):
     def _check_terminology(self, state: WorkflowState) -> dict:
         if state.document_type.lower() != "legal":
             return {"passed": True, "message": "Terminology check skipped"}
-        legal_terms = ["agreement", "contract", "party", "clause", "liability"]
-        found = sum(1 for term in legal_terms if term in state.raw_text.lower())
+        lowered = get_lowered_text(state.raw_text)
+        found = sum(1 for term in _LEGAL_TERMS if term in lowered)
         if found == 0:
             return {
                 "passed": True,
@@ -16,6 +16,9 @@ class Settings(BaseSettings):
     default_document_type: str = Field(default="legal", alias="DEFAULT_DOCUMENT_TYPE")
     default_max_retries: int = Field(default=1, alias="DEFAULT_MAX_RETRIES")
     sla_seconds: int = Field(default=120, alias="SLA_SECONDS")
+    exec_max_parallel: int = Field(default=8, alias="EXEC_MAX_PARALLEL")
+    exec_gemini_batch: int = Field(default=8, alias="EXEC_GEMINI_BATCH")
+    max_parallel_workflows: int = Field(default=4, alias="MAX_PARALLEL_WORKFLOWS")
 
 
 @lru_cache(maxsize=1)
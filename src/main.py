@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 from pathlib import Path
 
 from src.config.settings import get_settings
+from src.utils.json_output import dump_json_pretty
 from src.workflow.orchestrator import WorkflowOrchestrator
 
 
@@ -48,8 +49,12 @@ def main() -> None:
 
     output_path = Path(args.output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(response, indent=2), encoding="utf-8")
-    print(json.dumps(response, indent=2))
+    payload = dump_json_pretty(response)
+    output_path.write_bytes(payload)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload)
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -4,11 +4,9 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
-from src.models.workflow_state import QAStatus
-
 
 class QAReport(BaseModel):
-    status: QAStatus
+    status: str
     quality_score: float
     checks: dict = Field(default_factory=dict)
     failed_checks: list[str] = Field(default_factory=list)
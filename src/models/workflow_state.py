@@ -1,29 +1,35 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Mapping
 from datetime import datetime
-from enum import Enum
+from typing import Any, Final
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
-class WorkflowStatus(str, Enum):
-    PENDING = "pending"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    PAUSED = "paused"
+class WorkflowStatus:
+    """Workflow status values; plain strings, so comparisons and serialization skip Enum machinery."""
 
+    PENDING: Final[str] = "pending"
+    IN_PROGRESS: Final[str] = "in_progress"
+    COMPLETED: Final[str] = "completed"
+    FAILED: Final[str] = "failed"
+    PAUSED: Final[str] = "paused"
 
-class QAStatus(str, Enum):
-    PASS = "pass"
-    FAIL = "fail"
-    PENDING = "pending"
+
+class QAStatus:
+    PASS: Final[str] = "pass"
+    FAIL: Final[str] = "fail"
+    PENDING: Final[str] = "pending"
 
 
 class WorkflowState(BaseModel):
     """Shared state object across the full workflow."""
 
+    # Requests are validated once on entry; agents then mutate fields freely without re-validation.
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+
     request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
@@ -33,7 +39,7 @@ class WorkflowState(BaseModel):
     page_count: int = 1
     raw_text: str = ""
 
-    status: WorkflowStatus = WorkflowStatus.PENDING
+    status: str = WorkflowStatus.PENDING
     run_status: str = "pending"
     current_agent: str | None = None
     execution_plan: list[str] = Field(default_factory=list)
@@ -67,14 +73,32 @@ class WorkflowState(BaseModel):
     errors: list[str] = Field(default_factory=list)
     warnings: list[str] = Field(default_factory=list)
 
+    # Mirror `errors`/`warnings` for O(1) de-dup; the lists stay the serialized source of truth.
+    _error_set: set[str] = PrivateAttr(default_factory=set)
+    _warning_set: set[str] = PrivateAttr(default_factory=set)
+
+    @classmethod
+    def from_request(cls, request: Mapping[str, Any]) -> WorkflowState:
+        """Validate an incoming request payload once at the workflow boundary."""
+        return cls.model_validate(request)
+
+    def model_post_init(self, __context) -> None:
+        self._error_set = set(self.errors)
+        self._warning_set = set(self.warnings)
+
     def add_error(self, message: str) -> None:
-        if message not in self.errors:
+        if message not in self._error_set:
+            self._error_set.add(message)
             self.errors.append(message)
 
     def add_warning(self, message: str) -> None:
-        if message not in self.warnings:
+        if message not in self._warning_set:
+            self._warning_set.add(message)
             self.warnings.append(message)
 
+    def has_warning(self, message: str) -> bool:
+        return message in self._warning_set
+
     def set_step_status(self, step: str, status: str) -> None:
         self.step_status[step] = status
 
@@ -1,9 +1,15 @@
+from src.utils.json_output import dump_json_pretty
 from src.utils.logger import setup_logger
 from src.utils.metrics import SLAMonitor
 from src.utils.pdf_export import build_translated_document_pdf
+from src.utils.text_stats import TextStats, get_lowered_text, get_text_stats
 
 __all__ = [
+    "dump_json_pretty",
     "setup_logger",
     "SLAMonitor",
     "build_translated_document_pdf",
+    "TextStats",
+    "get_text_stats",
+    "get_lowered_text",
 ]
@@ -1,10 +1,40 @@
 from __future__ import annotations
 
+import os
 from io import BytesIO
+from typing import Callable
+
+# Page counts above which fanning out to worker processes beats the ~0.5s spawn cost per worker.
+# PyMuPDF extracts a page in under a millisecond, pypdf takes several, hence the different thresholds.
+_PYMUPDF_PARALLEL_MIN_PAGES = 1000
+_PYPDF_PARALLEL_MIN_PAGES = 250
+_MAX_EXTRACT_WORKERS = 4
 
 
 def extract_text_from_pdf_bytes(data: bytes) -> tuple[str, int]:
     """Return extracted text and page count from PDF bytes."""
+    try:
+        import pymupdf
+    except ImportError:
+        # PyMuPDF is the fast path; pypdf stays as the pure-Python fallback.
+        return _extract_with_pypdf(data)
+    return _extract_with_pymupdf(pymupdf, data)
+
+
+def _extract_with_pymupdf(pymupdf, data: bytes) -> tuple[str, int]:
+    doc = pymupdf.open(stream=data, filetype="pdf")
+    try:
+        page_count = doc.page_count
+        if _use_process_pool(page_count, _PYMUPDF_PARALLEL_MIN_PAGES):
+            pages_text = _extract_in_processes(_pymupdf_page_range, data, page_count)
+        else:
+            pages_text = [page.get_text("text") for page in doc]
+    finally:
+        doc.close()
+    return _join_pages(pages_text), page_count
+
+
+def _extract_with_pypdf(data: bytes) -> tuple[str, int]:
     try:
         from pypdf import PdfReader
     except Exception as exc:  # pragma: no cover - environment dependent
@@ -13,12 +43,80 @@ def extract_text_from_pdf_bytes(data: bytes) -> tuple[str, int]:
         ) from exc
 
     reader = PdfReader(BytesIO(data))
-    pages_text: list[str] = []
-    for page in reader.pages:
-        pages_text.append(page.extract_text() or "")
+    page_count = len(reader.pages)
+    if _use_process_pool(page_count, _PYPDF_PARALLEL_MIN_PAGES):
+        pages_text = _extract_in_processes(_pypdf_page_range, data, page_count)
+    else:
+        pages_text = [_pypdf_page_text(page) for page in reader.pages]
+    return _join_pages(pages_text), page_count
+
+
+def _use_process_pool(page_count: int, min_pages: int) -> bool:
+    return page_count >= min_pages and (os.cpu_count() or 1) > 1
+
+
+def _extract_in_processes(
+    extract_range: Callable[[bytes, int, int], list[str]],
+    data: bytes,
+    page_count: int,
+) -> list[str]:
+    # Processes rather than threads: PyMuPDF is not thread-safe and pypdf never releases the GIL.
+    # Imported here because only very large documents take this path.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(_MAX_EXTRACT_WORKERS, os.cpu_count() or 1)
+    step = -(-page_count // workers)
+    starts = list(range(0, page_count, step))
+    stops = [min(page_count, start + step) for start in starts]
+    # spawn avoids forking the multi-threaded Streamlit server.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(starts), mp_context=context) as pool:
+        parts = pool.map(extract_range, [data] * len(starts), starts, stops)
+        return [text for part in parts for text in part]
+
+
+def _pymupdf_page_range(data: bytes, start: int, stop: int) -> list[str]:
+    import pymupdf
+
+    doc = pymupdf.open(stream=data, filetype="pdf")
+    try:
+        return [doc.load_page(index).get_text("text") for index in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _pypdf_page_range(data: bytes, start: int, stop: int) -> list[str]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(BytesIO(data))
+    return [_pypdf_page_text(reader.pages[index]) for index in range(start, stop)]
+
+
+def _pypdf_page_text(page) -> str:
+    # Scanned pages carry no fonts; skip pypdf's content-stream interpreter for them entirely.
+    if not _pypdf_page_may_have_text(page):
+        return ""
+    return page.extract_text() or ""
+
+
+def _pypdf_page_may_have_text(page) -> bool:
+    resources = page.get("/Resources")
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if "/Font" in resources:
+        return True
+    # Text can also live in form XObjects, which bring their own font resources.
+    xobjects = resources.get("/XObject")
+    if xobjects is None:
+        return False
+    return any(xobject.get_object().get("/Subtype") == "/Form" for xobject in xobjects.get_object().values())
+
 
-    content = "\n\n".join(chunk.strip() for chunk in pages_text if chunk.strip()).strip()
-    return content, len(reader.pages)
+def _join_pages(pages_text: list[str]) -> str:
+    # Strip each page once; the pieces are already trimmed, so the joined text needs no final strip.
+    return "\n\n".join([text for page in pages_text if (text := page.strip())])
 
 
 def extract_text_from_txt_bytes(data: bytes) -> str:
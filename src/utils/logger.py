@@ -1,8 +1,66 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
 
+_FILE_BUFFER_CAPACITY = 512
+# Upper bound on how long a buffered line waits for disk, so quiet loggers in the long-running
+# server are not held back until their buffer fills.
+_FILE_FLUSH_INTERVAL_SECONDS = 1.0
+
+# File output is written by one background listener so agents never block on disk I/O.
+_log_queue: queue.Queue = queue.Queue(-1)
+_file_targets: dict[str, MemoryHandler] = {}
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+_flusher_stop = threading.Event()
+
+
+class _PerLoggerFileHandler(logging.Handler):
+    """Route queued records to the buffered file handler of the logger that emitted them."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        target = _file_targets.get(record.name)
+        if target is not None:
+            target.handle(record)
+
+
+def _ensure_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        _listener = QueueListener(_log_queue, _PerLoggerFileHandler())
+        _listener.start()
+        _flusher_stop.clear()
+        threading.Thread(target=_flush_periodically, name="log-flusher", daemon=True).start()
+        atexit.register(_stop_listener)
+
+
+def _flush_periodically() -> None:
+    while not _flusher_stop.wait(_FILE_FLUSH_INTERVAL_SECONDS):
+        _flush_file_targets()
+
+
+def _flush_file_targets() -> None:
+    for target in list(_file_targets.values()):
+        target.flush()
+
+
+def _stop_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
+        _flusher_stop.set()
+    _flush_file_targets()
+
 
 def setup_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -20,7 +78,14 @@ def setup_logger(name: str) -> logging.Logger:
     logs_dir.mkdir(parents=True, exist_ok=True)
     file_handler = logging.FileHandler(logs_dir / f"{name}.log", encoding="utf-8")
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # Batches writes; warnings and errors flush immediately so they are never left sitting in the buffer.
+    _file_targets[name] = MemoryHandler(
+        capacity=_FILE_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+    )
+    logger.addHandler(QueueHandler(_log_queue))
+    _ensure_listener()
     logger.propagate = False
 
     return logger
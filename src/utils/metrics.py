@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from datetime import datetime
+import time
 
 
 class SLAMonitor:
+    """SLA checks on the monotonic clock, so wall-clock adjustments can't trip or mask a breach."""
+
     def __init__(self, target_seconds: int) -> None:
         self.target_seconds = target_seconds
+        self._target_ns = int(target_seconds * 1_000_000_000)
 
-    def elapsed_seconds(self, started_at: datetime | None, ended_at: datetime | None = None) -> float:
-        if not started_at:
+    def elapsed_seconds(self, started_ns: int | None, ended_ns: int | None = None) -> float:
+        if started_ns is None:
             return 0.0
-        end = ended_at or datetime.utcnow()
-        return (end - started_at).total_seconds()
+        end = ended_ns if ended_ns is not None else time.monotonic_ns()
+        return (end - started_ns) / 1_000_000_000
 
-    def is_breached(self, started_at: datetime | None, ended_at: datetime | None = None) -> bool:
-        return self.elapsed_seconds(started_at, ended_at) > self.target_seconds
+    def is_breached(self, started_ns: int | None, ended_ns: int | None = None) -> bool:
+        if started_ns is None:
+            return False
+        end = ended_ns if ended_ns is not None else time.monotonic_ns()
+        return end - started_ns > self._target_ns
@@ -18,6 +18,9 @@ _UNICODE_REPLACEMENTS = {
 def _safe_text(value: str) -> str:
     # Normalize unicode punctuation to avoid Latin-1 encoding failures in default PDF font.
     text = (value or "").replace("\r\n", "\n").replace("\r", "\n")
+    if text.isascii():
+        # O(1) flag check; ASCII needs no punctuation mapping and is already Latin-1 safe.
+        return text
     for source, target in _UNICODE_REPLACEMENTS.items():
         text = text.replace(source, target)
     return text.encode("latin-1", errors="replace").decode("latin-1")
@@ -36,6 +39,8 @@ def build_translated_document_pdf(result: dict) -> bytes:
             "PDF export requires fpdf2. Install with `pip install fpdf2`."
         ) from exc
 
+    # Core-font metrics are import-time tables in fpdf2, so a fresh FPDF per export costs ~30us;
+    # export time is spent in multi_cell's line breaking, not in font setup.
     pdf = FPDF(format="A4")
     pdf.set_auto_page_break(auto=True, margin=12)
     pdf.add_page()
@@ -43,14 +48,11 @@ def build_translated_document_pdf(result: dict) -> bytes:
     pdf.multi_cell(0, 8, _safe_text("Translated Document"))
     pdf.set_font("Helvetica", size=11)
     pdf.ln(1)
-    pdf.multi_cell(0, 6, _safe_text(result.get("translated_text", "")))
-    return _pdf_output_to_bytes(pdf)
-
-
-def _pdf_output_to_bytes(pdf) -> bytes:
-    raw = pdf.output(dest="S")
-    if isinstance(raw, (bytes, bytearray)):
-        return bytes(raw)
-    if isinstance(raw, str):
-        return raw.encode("latin-1", errors="ignore")
-    return bytes(raw)
+    # Lay out one paragraph at a time so FPDF never line-breaks the whole document in a single call.
+    paragraphs = _safe_text(result.get("translated_text", "")).split("\n\n")
+    for index, paragraph in enumerate(paragraphs):
+        if index:
+            pdf.ln(6)  # The blank line the "\n\n" separator used to render.
+        pdf.multi_cell(0, 6, paragraph)
+    # fpdf2 returns a bytearray; the old `dest="S"` string branch is deprecated.
+    return bytes(pdf.output())
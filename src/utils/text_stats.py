@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+_ALPHA_RE = re.compile(r"[A-Za-z]{3,}")
+
+
+@dataclass(slots=True, frozen=True)
+class TextStats:
+    word_count: int
+    newline_count: int
+    numbers: tuple[str, ...]
+    alpha_tokens: frozenset[str]
+
+
+@lru_cache(maxsize=16)
+def get_text_stats(text: str) -> TextStats:
+    """
+    Scan a text once and share the result across agents.
+
+    Keyed on the string value (not its id) so a recycled id can never return stale stats;
+    str caches its own hash, so repeat lookups for the same object are cheap.
+    """
+    return TextStats(
+        word_count=len(text.split()),
+        newline_count=text.count("\n"),
+        numbers=tuple(_NUM_RE.findall(text)),
+        alpha_tokens=frozenset(token.lower() for token in _ALPHA_RE.findall(text)),
+    )
+
+
+@lru_cache(maxsize=4)
+def get_lowered_text(text: str) -> str:
+    """Lower-cased copy of a text, shared by the intake warm-up and QA terminology checks across retries."""
+    return text.lower()
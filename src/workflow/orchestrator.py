@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import ChainMap
 from typing import Any
 
 from src.agents.delivery_agent import DeliveryAgent
@@ -34,12 +35,15 @@ class WorkflowOrchestrator:
                 llm=llm,
                 google_api_key=direct_gemini_key,
                 gemini_model=settings.gemini_model,
+                max_parallel=settings.exec_max_parallel,
+                gemini_batch_size=settings.exec_gemini_batch,
             ),
             "qa": QAAgent("qa"),
             "judge": JudgeAgent("judge"),
             "delivery": DeliveryAgent("delivery"),
         }
         self.master = MasterAgent(worker_agents=self.workers, sla_seconds=settings.sla_seconds)
+        self.max_parallel_workflows = max(1, settings.max_parallel_workflows)
 
     async def execute_workflow(
         self,
@@ -47,11 +51,12 @@ class WorkflowOrchestrator:
         auto_approve: bool = True,
         progress_callback: Any | None = None,
     ) -> dict[str, Any]:
-        request_payload = dict(request)
-        request_payload["requested_real_llm"] = self.use_real_llm
+        overrides: dict[str, Any] = {"requested_real_llm": self.use_real_llm}
         if self.init_warnings:
-            request_payload.setdefault("warnings", [])
-            request_payload["warnings"].extend(self.init_warnings)
+            # A new list, so the caller's warnings are never extended in place.
+            overrides["warnings"] = [*request.get("warnings", []), *self.init_warnings]
+        # Layer the overrides over the caller's request instead of copying it.
+        request_payload = ChainMap(overrides, request)
         final_state = await self.master.orchestrate(
             request_payload,
             auto_approve=auto_approve,
@@ -59,6 +64,20 @@ class WorkflowOrchestrator:
         )
         return self._to_response(final_state)
 
+    async def execute_workflows(
+        self,
+        requests: list[dict[str, Any]],
+        auto_approve: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Run independent documents concurrently so their LLM waits overlap; results keep request order."""
+        semaphore = asyncio.Semaphore(self.max_parallel_workflows)
+
+        async def run_one(request: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.execute_workflow(request, auto_approve=auto_approve)
+
+        return list(await asyncio.gather(*(run_one(request) for request in requests)))
+
     def execute_workflow_sync(
         self,
         request: dict[str, Any],
@@ -81,6 +100,8 @@ class WorkflowOrchestrator:
             self.logger.warning(message)
             self.init_warnings.append(message)
             return None
+        # Built per orchestrator: the client's async HTTP pool is bound to the event loop of its first
+        # call, and every sync run (one per Streamlit run) starts a fresh loop with asyncio.run.
         try:
             from langchain_google_genai import ChatGoogleGenerativeAI
 
@@ -97,7 +118,7 @@ class WorkflowOrchestrator:
         if state.status == WorkflowStatus.PAUSED:
             return {
                 "request_id": state.request_id,
-                "status": state.run_status or state.status.value,
+                "status": state.run_status or state.status,
                 "pause_reason": state.pause_reason,
                 "current_agent": state.current_agent,
                 "route_history": state.route_history,
@@ -110,7 +131,7 @@ class WorkflowOrchestrator:
             return state.final_output
         return {
             "request_id": state.request_id,
-            "status": state.run_status or state.status.value,
+            "status": state.run_status or state.status,
             "errors": state.errors,
             "warnings": state.warnings,
         }
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 from src.models.workflow_state import QAStatus, WorkflowState
 
+# Transitions that never depend on state; only planner, qa and judge need to inspect it.
+_STATIC_NEXT_STEP = {
+    "intake": "planner",
+    "execution": "qa",
+    "delivery": "end",
+}
+
 
 def determine_next_step(current_step: str, state: WorkflowState) -> str:
-    if current_step == "intake":
-        return "planner"
+    next_step = _STATIC_NEXT_STEP.get(current_step)
+    if next_step is not None:
+        return next_step
     if current_step == "planner":
         if state.requires_approval and state.approval_granted is None:
             return "pause_for_approval"
         return "execution"
-    if current_step == "execution":
-        return "qa"
     if current_step == "qa":
         qa_status = state.qa_result.get("status")
         if qa_status == QAStatus.FAIL and state.retry_count < state.max_retries:
@@ -22,6 +28,4 @@ def determine_next_step(current_step: str, state: WorkflowState) -> str:
         if action == "retry" and state.retry_count < state.max_retries:
             return "execution"
         return "delivery"
-    if current_step == "delivery":
-        return "end"
     return "end"
@@ -1,23 +1,113 @@
 from __future__ import annotations
 
-import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from src.models.workflow_state import WorkflowState
+from src.utils.logger import setup_logger
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional accelerator
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+_STATE_FIELD_NAMES = tuple(WorkflowState.model_fields)
+
+
+def _build_snapshot_decoder():
+    """Typed msgspec decoder derived from WorkflowState's own fields, so there is no hand-kept mirror."""
+    if msgspec is None:
+        return None
+    fields = []
+    for name, field in WorkflowState.model_fields.items():
+        if field.default_factory is not None:
+            fields.append((name, field.annotation, msgspec.field(default_factory=field.default_factory)))
+        elif field.is_required():
+            fields.append((name, field.annotation))
+        else:
+            fields.append((name, field.annotation, field.default))
+    struct_type = msgspec.defstruct("WorkflowStateSnapshot", fields, kw_only=True)
+    return msgspec.json.Decoder(struct_type)
+
+
+_snapshot_decoder = _build_snapshot_decoder()
+
+# One writer thread for every manager keeps snapshot writes in submission order.
+_snapshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-writer")
 
 
 class StateManager:
     def __init__(self, state_dir: str = "logs/states") -> None:
         self.state_dir = Path(state_dir)
         self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.logger = setup_logger("state_manager")
+        self._pending: dict[Path, bytes] = {}
+        self._pending_lock = threading.Lock()
 
     def save(self, state: WorkflowState) -> None:
+        """Write a snapshot and block until it, and anything queued before it, is on disk."""
+        self.enqueue(state).result()
+
+    def enqueue(self, state: WorkflowState) -> Future:
+        """
+        Serialize the state now and write it on the background writer thread.
+
+        Snapshots queued for the same request before the writer gets to them are coalesced,
+        so only the latest one is written.
+        """
         state_path = self.state_dir / f"{state.request_id}.json"
-        state_path.write_text(state.model_dump_json(indent=2), encoding="utf-8")
+        payload = _encode_snapshot(state)
+        with self._pending_lock:
+            self._pending[state_path] = payload
+        future = _snapshot_writer.submit(self._write_latest, state_path)
+        future.add_done_callback(self._report_write_failure)
+        return future
+
+    def _write_latest(self, state_path: Path) -> None:
+        with self._pending_lock:
+            payload = self._pending.pop(state_path, None)
+        if payload is not None:
+            state_path.write_bytes(payload)
+
+    def _report_write_failure(self, future: Future) -> None:
+        exc = future.exception()
+        if exc is not None:
+            self.logger.error("State snapshot write failed: %s", exc)
 
     def load(self, request_id: str) -> WorkflowState | None:
         state_path = self.state_dir / f"{request_id}.json"
         if not state_path.exists():
             return None
-        payload = json.loads(state_path.read_text(encoding="utf-8"))
-        return WorkflowState(**payload)
+        return _decode_snapshot(state_path.read_bytes())
+
+
+def _encode_snapshot(state: WorkflowState) -> bytes:
+    if orjson is not None:
+        try:
+            # The instance dict already holds exactly the model fields, so there is no field plan to
+            # rebuild per call; orjson yields the same bytes as pydantic.
+            return orjson.dumps(state.__dict__)
+        except TypeError:
+            # Values orjson cannot encode (arbitrary objects in result dicts) go through pydantic.
+            pass
+    # Compact on purpose: snapshots are machine-read; use `python -m json.tool` to inspect one.
+    return state.model_dump_json().encode("utf-8")
+
+
+def _decode_snapshot(data: bytes) -> WorkflowState:
+    if _snapshot_decoder is not None:
+        try:
+            # The typed decode already yields datetimes and validated field types,
+            # so pydantic's validation can be skipped.
+            snapshot = _snapshot_decoder.decode(data)
+        except msgspec.ValidationError:
+            pass
+        else:
+            return WorkflowState.model_construct(**{name: getattr(snapshot, name) for name in _STATE_FIELD_NAMES})
+    return WorkflowState.model_validate_json(data)
@@ -1,12 +1,17 @@
 import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
 
 from src.agents.delivery_agent import DeliveryAgent
-from src.agents.execution_agent import ExecutionAgent
+from src.agents.execution_agent import ExecutionAgent, _translation_cache_clear
 from src.agents.intake_agent import IntakeAgent
 from src.agents.planner_agent import PlannerAgent
 from src.agents.qa_agent import QAAgent
 from src.models.workflow_state import WorkflowState
 from src.utils.mock_data import SAMPLE_LEGAL_TEXT
+from src.utils.text_stats import get_text_stats
 
 
 def _base_state() -> WorkflowState:
@@ -20,6 +25,43 @@ def _base_state() -> WorkflowState:
     )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_translation_cache():
+    # The translation cache is process-wide; without this, tests see each other's translations.
+    _translation_cache_clear()
+    yield
+    _translation_cache_clear()
+
+
+@pytest.fixture
+def fake_gemini(monkeypatch):
+    """Install a stub google.genai client whose streamed pieces come from `respond(prompt)`."""
+    from google import genai
+
+    def install(respond):
+        recorder = SimpleNamespace(prompts=[], clients=[], proxy_env=[])
+
+        class _FakeModels:
+            def generate_content_stream(self, model: str, contents: str):
+                recorder.prompts.append(contents)
+                return iter([SimpleNamespace(text=text) for text in respond(contents)])
+
+        class _FakeClient:
+            def __init__(self, api_key: str) -> None:
+                self.models = _FakeModels()
+                recorder.clients.append(self)
+                recorder.proxy_env.append(os.environ.get("HTTPS_PROXY"))
+
+        monkeypatch.setattr(genai, "Client", _FakeClient)
+        return recorder
+
+    return install
+
+
+def _upper_text(prompt: str) -> list[str]:
+    return [prompt.split("Text:\n", 1)[1].upper()]
+
+
 def test_agent_pipeline_happy_path():
     state = _base_state()
 
@@ -51,3 +93,85 @@ def test_agent_pipeline_happy_path():
     assert state.translation_output
     assert "quality_score" in qa_result
     assert delivery_result["request_id"] == state.request_id
+
+
+def test_intake_warms_shared_text_stats():
+    state = _base_state()
+    get_text_stats.cache_clear()
+
+    metadata = asyncio.run(IntakeAgent("intake").execute(state))
+    stats = get_text_stats(state.raw_text)
+
+    assert get_text_stats.cache_info().hits == 1
+    assert metadata["word_count"] == stats.word_count == len(SAMPLE_LEGAL_TEXT.split())
+    assert stats.newline_count == SAMPLE_LEGAL_TEXT.count("\n")
+    assert "agreement" in stats.alpha_tokens
+
+
+def test_direct_gemini_streams_tokens(fake_gemini):
+    gemini = fake_gemini(lambda prompt: ["Hola ", "mundo"])
+    state = _base_state()
+    state.raw_text = "Hello world\n\nHello again"
+    execution = ExecutionAgent("execution", google_api_key="test-key", gemini_batch_size=1)
+    tokens: list[str] = []
+
+    result = asyncio.run(execution.execute(state, on_token=tokens.append))
+
+    assert tokens == ["Hola ", "mundo", "Hola ", "mundo"]
+    assert result["translation"] == "Hola mundo\n\nHola mundo"
+    assert result["method"] == "direct_gemini"
+    assert len(gemini.clients) == 1
+
+
+def test_broken_proxy_env_is_scrubbed_only_while_building_the_client(fake_gemini, monkeypatch):
+    gemini = fake_gemini(lambda prompt: ["Hola"])
+    monkeypatch.setenv("HTTPS_PROXY", "http://127.0.0.1:9")
+
+    ExecutionAgent("execution", google_api_key="test-key")
+
+    assert gemini.proxy_env == [None]
+    assert os.environ["HTTPS_PROXY"] == "http://127.0.0.1:9"
+
+
+def test_parallel_execution_reports_chunks_and_keeps_order():
+    state = _base_state()
+    state.raw_text = "first agreement\n\nsecond payment\n\nthird client"
+    execution = ExecutionAgent("execution", max_parallel=2)
+    completed: list[tuple[int, int]] = []
+
+    result = asyncio.run(
+        execution.execute(state, on_chunk_done=lambda index, total, text: completed.append((index, total)))
+    )
+
+    assert sorted(completed) == [(0, 3), (1, 3), (2, 3)]
+    assert result["translation"] == "[es] first acuerdo\n\n[es] second pago\n\n[es] third cliente"
+
+
+def test_direct_gemini_batches_chunks_into_one_request(fake_gemini):
+    gemini = fake_gemini(_upper_text)
+    state = _base_state()
+    state.raw_text = "one\n\ntwo\n\nthree"
+    execution = ExecutionAgent("execution", google_api_key="test-key", gemini_batch_size=2)
+
+    result = asyncio.run(execution.execute(state))
+
+    assert len(gemini.prompts) == 2
+    assert result["translation"] == "ONE\n\nTWO\n\nTHREE"
+
+
+def test_direct_gemini_reuses_cached_chunk_translations(fake_gemini):
+    gemini = fake_gemini(_upper_text)
+    state = _base_state()
+    state.raw_text = "Signature block\n\nBody clause\n\nSignature block"
+
+    first = asyncio.run(ExecutionAgent("execution", google_api_key="test-key", gemini_batch_size=1).execute(state))
+    assert len(gemini.prompts) == 2
+    assert first["translation"] == "SIGNATURE BLOCK\n\nBODY CLAUSE\n\nSIGNATURE BLOCK"
+
+    second = asyncio.run(ExecutionAgent("execution", google_api_key="test-key", gemini_batch_size=1).execute(state))
+    assert len(gemini.prompts) == 2
+    assert second["translation"] == first["translation"]
+
+    state.retry_count = 1
+    asyncio.run(ExecutionAgent("execution", google_api_key="test-key", gemini_batch_size=1).execute(state))
+    assert len(gemini.prompts) == 4
@@ -0,0 +1,51 @@
+from fpdf import FPDF
+
+from src.utils import document_parser
+from src.utils.document_parser import extract_text_from_pdf_bytes
+
+
+def _sample_pdf_bytes(pages: int = 3) -> bytes:
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=12)
+    for index in range(pages):
+        pdf.add_page()
+        pdf.multi_cell(0, 6, f"Page {index} AGREEMENT\nThe party agrees to clause {index}.")
+    return bytes(pdf.output())
+
+
+def test_pdf_extraction_matches_pypdf_fallback():
+    data = _sample_pdf_bytes()
+
+    text, page_count = extract_text_from_pdf_bytes(data)
+
+    assert page_count == 3
+    assert text.split("\n\n")[0] == "Page 0 AGREEMENT\nThe party agrees to clause 0."
+    assert (text, page_count) == document_parser._extract_with_pypdf(data)
+
+
+def test_process_pool_extraction_keeps_page_order(monkeypatch):
+    data = _sample_pdf_bytes(pages=5)
+    monkeypatch.setattr(document_parser.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(document_parser, "_PYPDF_PARALLEL_MIN_PAGES", 2)
+
+    text, page_count = document_parser._extract_with_pypdf(data)
+
+    assert page_count == 5
+    assert [page.splitlines()[0] for page in text.split("\n\n")] == [f"Page {i} AGREEMENT" for i in range(5)]
+
+
+def test_pypdf_skips_pages_without_text_resources():
+    from io import BytesIO
+
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter(clone_from=BytesIO(_sample_pdf_bytes(pages=2)))
+    writer.add_blank_page()
+    buffer = BytesIO()
+    writer.write(buffer)
+    reader = PdfReader(BytesIO(buffer.getvalue()))
+
+    assert [document_parser._pypdf_page_may_have_text(page) for page in reader.pages] == [True, True, False]
+    text, page_count = document_parser._extract_with_pypdf(buffer.getvalue())
+    assert page_count == 3
+    assert text.split("\n\n")[-1] == "Page 1 AGREEMENT\nThe party agrees to clause 1."
@@ -1,8 +1,10 @@
 from pathlib import Path
 import asyncio
 
+from src.models.workflow_state import WorkflowState, WorkflowStatus
 from src.utils.mock_data import sample_request
 from src.workflow.orchestrator import WorkflowOrchestrator
+from src.workflow.state_manager import StateManager
 
 
 def test_retry_logic_runs_after_qa_failure():
@@ -24,3 +26,32 @@ def test_state_snapshot_saved():
     request_id = result["request_id"]
     snapshot = Path("logs/states") / f"{request_id}.json"
     assert snapshot.exists()
+
+
+def test_state_snapshot_round_trips():
+    orchestrator = WorkflowOrchestrator(use_real_llm=False)
+    result = asyncio.run(orchestrator.execute_workflow(sample_request(), auto_approve=True))
+
+    state = StateManager().load(result["request_id"])
+
+    assert state is not None
+    assert state.status == WorkflowStatus.COMPLETED
+    assert state.run_status == result["status"]
+    assert state.start_time is not None and state.end_time >= state.start_time
+    snapshot_path = StateManager().state_dir / f"{result['request_id']}.json"
+    assert snapshot_path.read_bytes() == state.model_dump_json().encode("utf-8")
+
+
+def test_state_manager_background_writes_land_in_order(tmp_path):
+    manager = StateManager(state_dir=str(tmp_path))
+    state = WorkflowState(raw_text="Sample")
+    for retry_count in range(5):
+        state.retry_count = retry_count
+        manager.enqueue(state)
+    state.run_status = "completed"
+    manager.save(state)
+
+    loaded = manager.load(state.request_id)
+
+    assert loaded.retry_count == 4
+    assert loaded.run_status == "completed"
@@ -24,3 +24,101 @@ def test_workflow_can_pause_for_human_approval():
 
     assert result["status"] == "paused"
     assert "pause_reason" in result
+
+
+def test_workflow_coalesces_intermediate_snapshot_saves(monkeypatch):
+    orchestrator = WorkflowOrchestrator(use_real_llm=False)
+    orchestrator.master.save_interval_seconds = 60.0
+    saved_statuses: list[str] = []
+    for method in ("save", "enqueue"):
+        monkeypatch.setattr(
+            orchestrator.master.state_manager,
+            method,
+            lambda state: saved_statuses.append(state.run_status),
+        )
+
+    result = asyncio.run(orchestrator.execute_workflow(sample_request(), auto_approve=True))
+
+    # Only the initial snapshot and the forced terminal one are written inside the interval.
+    assert saved_statuses == ["in_progress", result["status"]]
+
+
+def test_workflows_run_concurrently_and_keep_request_order():
+    orchestrator = WorkflowOrchestrator(use_real_llm=False)
+    requests = []
+    for target in ("es", "fr", "de"):
+        request = sample_request()
+        request["target_language"] = target
+        requests.append(request)
+
+    results = asyncio.run(orchestrator.execute_workflows(requests))
+
+    assert [result["target_language"] for result in results] == ["es", "fr", "de"]
+    assert len({result["request_id"] for result in results}) == 3
+
+
+def test_concurrent_workflows_share_the_model_call_cap(monkeypatch):
+    orchestrator = WorkflowOrchestrator(use_real_llm=False)
+    execution = orchestrator.workers["execution"]
+    execution.max_parallel = 2
+    in_flight = 0
+    peak = 0
+
+    async def slow_translate_batch(chunks, state, on_token=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [execution._mock_translate(chunk, state.target_language) for chunk in chunks]
+
+    monkeypatch.setattr(execution, "_translate_batch", slow_translate_batch)
+    requests = [sample_request() for _ in range(3)]
+
+    results = asyncio.run(orchestrator.execute_workflows(requests))
+
+    assert all(result["status"] == "completed" for result in results)
+    assert peak == 2
+
+
+def test_init_warnings_do_not_mutate_the_callers_request():
+    orchestrator = WorkflowOrchestrator(use_real_llm=False)
+    orchestrator.init_warnings.append("LLM unavailable.")
+    request = sample_request()
+    request["warnings"] = ["Uploaded file was truncated."]
+
+    result = asyncio.run(orchestrator.execute_workflow(request))
+
+    assert request["warnings"] == ["Uploaded file was truncated."]
+    assert {"Uploaded file was truncated.", "LLM unavailable."} <= set(result["metadata"]["warnings"])
+
+
+def test_llm_client_is_built_per_orchestrator_and_failures_are_not_kept(monkeypatch):
+    import langchain_google_genai
+
+    from src.config.settings import get_settings
+
+    built: list[object] = []
+
+    class _FakeChat:
+        def __init__(self, **kwargs) -> None:
+            if not built:
+                built.append(None)
+                raise RuntimeError("transient construction failure")
+            built.append(self)
+
+        def __call__(self, prompt):
+            return "translated"
+
+    monkeypatch.setattr(langchain_google_genai, "ChatGoogleGenerativeAI", _FakeChat)
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    get_settings.cache_clear()
+    try:
+        orchestrators = [WorkflowOrchestrator(use_real_llm=True) for _ in range(3)]
+    finally:
+        get_settings.cache_clear()
+
+    llms = [orchestrator.workers["execution"].llm for orchestrator in orchestrators]
+    assert llms == built
+    assert llms[0] is None
+    assert llms[1] is not None and llms[2] is not None and llms[1] is not llms[2]